@@ -0,0 +1,57 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""Filled-circle rasterizer used by finger_game.py for objects and particles.
+
+Writes straight into a BGR uint8 image, one call for a whole batch of
+circles, without the GIL.
+"""
+from libc.stdint cimport uint8_t, int32_t
+
+
+def draw_circles(uint8_t[:, :, ::1] img, float[::1] xs, float[::1] ys,
+                 int32_t[::1] radii, uint8_t[:, ::1] colors, bint outline=False):
+    """Fill circle i at (xs[i], ys[i]) with radius radii[i] and colors[i].
+
+    With `outline`, each circle also gets a white ring covering
+    (r-1)^2 < d^2 <= (r+1)^2. That approximates
+    cv2.circle(..., thickness=2) but is not pixel-identical to it.
+    Circles are clipped to the image.
+    """
+    with nogil:
+        _draw_circles(img, xs, ys, radii, colors, outline)
+
+
+cdef void _draw_circles(uint8_t[:, :, ::1] img, float[::1] xs, float[::1] ys,
+                        int32_t[::1] radii, uint8_t[:, ::1] colors, bint outline) noexcept nogil:
+    cdef Py_ssize_t h = img.shape[0], w = img.shape[1]
+    cdef Py_ssize_t i, x, y, x0, x1, y0, y1
+    cdef int cx, cy, r, r_out, dx, dy, d2, fill2, ring2
+    cdef uint8_t b, g, red
+
+    for i in range(xs.shape[0]):
+        cx = <int>xs[i]
+        cy = <int>ys[i]
+        r = radii[i]
+        r_out = r + 1 if outline else r
+        fill2 = (r - 1) * (r - 1) if outline else r * r
+        ring2 = r_out * r_out
+        b = colors[i, 0]
+        g = colors[i, 1]
+        red = colors[i, 2]
+
+        y0 = max(cy - r_out, 0)
+        y1 = min(cy + r_out + 1, h)
+        x0 = max(cx - r_out, 0)
+        x1 = min(cx + r_out + 1, w)
+        for y in range(y0, y1):
+            dy = <int>y - cy
+            for x in range(x0, x1):
+                dx = <int>x - cx
+                d2 = dx * dx + dy * dy
+                if d2 <= fill2:
+                    img[y, x, 0] = b
+                    img[y, x, 1] = g
+                    img[y, x, 2] = red
+                elif d2 <= ring2:
+                    img[y, x, 0] = 255
+                    img[y, x, 1] = 255
+                    img[y, x, 2] = 255
@@ -1,9 +1,23 @@
 import cv2
 import mediapipe as mp
-import random
 import time
+import threading
+import queue
 import numpy as np
-import math
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernels below are plain NumPy too
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    # Optional Cython rasterizer (circles.pyx), compiled on first import
+    import pyximport
+    pyximport.install(language_level=3)
+    from circles import draw_circles
+except ImportError:  # No Cython or no compiler: draw with cv2.circle
+    draw_circles = None
 
 # --- Configuration ---
 WINDOW_WIDTH = 1280
@@ -11,6 +25,16 @@ WINDOW_HEIGHT = 720
 STARTING_SPEED = 5
 MAX_SPEED = 15
 SPAWN_RATE = 25  # Frames between spawns
+PARTICLE_CAPACITY = 512
+OBJECT_CAPACITY = 64  # Grows if ever exceeded
+CURSOR_RADIUS = 15  # Finger cursor size, also its hit radius
+LASER_LENGTH = 100  # Pixels of "laser" drawn behind the cursor
+TRACK_EVERY_N = 2            # Run MediaPipe every Nth frame while a hand is locked on
+TRACK_MIN_CONFIDENCE = 0.7   # Below this, track every frame again
+TRACK_WIDTH = 640            # MediaPipe runs on a downscaled copy of the frame
+TRACK_HEIGHT = 360
+MENU_TRACK_EVERY = 6         # Camera frames per MediaPipe run on menu screens
+RENDER_FPS = 30              # Game ticks per second, independent of tracking speed
 
 # Colors (B, G, R)
 COLOR_PLAYER = (0, 255, 0)     # Green
@@ -18,209 +42,534 @@ COLOR_BOMB   = (0, 0, 255)     # Red
 COLOR_GOLD   = (0, 215, 255)   # Gold
 COLOR_TEXT   = (255, 255, 255)
 
-class Particle:
-    """Creates a small explosion effect."""
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx = random.uniform(-5, 5)
-        self.vy = random.uniform(-5, 5)
-        self.life = 1.0  # Life starts at 100%
-        self.decay = random.uniform(0.05, 0.1)
+class TextSprite:
+    """A string rasterized once with cv2.putText and then copied in by its mask."""
+    def __init__(self, text, scale, color, thickness):
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        (w, h), baseline = cv2.getTextSize(text, font, scale, thickness)
+        self.pad = thickness  # Thick strokes spill past the text box
+        self.ascent = h + self.pad
+        # Advance when composing sprites into a line: getTextSize adds the
+        # stroke thickness to the width, which must not repeat per piece
+        self.width = w - thickness
+
+        canvas = np.zeros((h + baseline + 2 * self.pad, w + 2 * self.pad, 4), np.uint8)
+        cv2.putText(canvas, text, (self.pad, self.ascent), font, scale, (*color, 255), thickness)
+        self.bgr = np.ascontiguousarray(canvas[..., :3])
+        self.mask = canvas[..., 3:] > 0
+
+    def draw(self, img, org):
+        """Draw with `org` at the bottom-left of the text, like cv2.putText."""
+        x0, y0 = org[0] - self.pad, org[1] - self.ascent
+        h, w = self.mask.shape[:2]
+        ih, iw = img.shape[:2]
+        left, top = max(x0, 0), max(y0, 0)
+        right, bottom = min(x0 + w, iw), min(y0 + h, ih)
+        if left >= right or top >= bottom:
+            return
+
+        src = (slice(top - y0, bottom - y0), slice(left - x0, right - x0))
+        np.copyto(img[top:bottom, left:right], self.bgr[src], where=self.mask[src])
+
+def draw_sprites(img, sprites, org):
+    """Draw `sprites` left to right as one line of text."""
+    x, y = org
+    for sprite in sprites:
+        sprite.draw(img, (x, y))
+        x += sprite.width
+
+# --- Physics kernels (JIT-compiled when Numba is available) ---
+@njit(cache=True, fastmath=True)
+def update_objects(xs, ys, reach2, speed, fx, fy, has_finger):
+    """Move objects down by `speed`. Returns (on-screen mask, finger hit mask)."""
+    ys += speed
+    alive = ys <= WINDOW_HEIGHT
+    if not has_finger:
+        return alive, np.zeros_like(alive)
+    dx = xs - fx
+    dy = ys - fy
+    return alive, alive & (dx * dx + dy * dy < reach2)
+
+@njit(cache=True, fastmath=True)
+def update_particles(x, y, vx, vy, life, decay):
+    x += vx
+    y += vy
+    life -= decay
+
+def warm_up_kernels():
+    """Compile the kernels up front with the argument types the game uses."""
+    floats, ints = np.zeros(0, np.float32), np.zeros(0, np.int32)
+    update_objects(floats, floats, ints, 0.0, 0.0, 0.0, False)
+    update_particles(floats, floats, floats, floats, floats, floats)
+
+class Particles:
+    """Small explosion effects, kept in a fixed-capacity pool of parallel arrays.
+
+    A slot is free whenever its life has dropped to zero, so spawning just
+    reuses dead slots and nothing is ever allocated or removed per frame.
+    """
+    def __init__(self, rng, capacity=PARTICLE_CAPACITY):
+        self.rng = rng
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.vx = np.zeros(capacity, np.float32)
+        self.vy = np.zeros(capacity, np.float32)
+        self.life = np.zeros(capacity, np.float32)
+        self.decay = np.zeros(capacity, np.float32)
+        self.color = np.zeros((capacity, 3), np.uint8)
+
+    def spawn(self, x, y, color, count):
+        slots = np.flatnonzero(self.life <= 0)[:count]
+        n = len(slots)
+        self.x[slots] = x
+        self.y[slots] = y
+        velocity = self.rng.uniform(-5, 5, size=(n, 2))
+        self.vx[slots] = velocity[:, 0]
+        self.vy[slots] = velocity[:, 1]
+        self.life[slots] = 1.0  # Life starts at 100%
+        self.decay[slots] = self.rng.uniform(0.05, 0.1, n)
+        self.color[slots] = color
 
     def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.life -= self.decay
+        update_particles(self.x, self.y, self.vx, self.vy, self.life, self.decay)
 
     def draw(self, img):
-        if self.life > 0:
-            alpha = int(self.life * 255)
-            # Draw faded circle (simulated by shrinking size)
-            size = int(5 * self.life)
-            cv2.circle(img, (int(self.x), int(self.y)), size, self.color, -1)
-
-class GameObject:
-    """Represents Fruits, Bombs, or Gold."""
-    def __init__(self, obj_type):
-        self.x = random.randint(50, WINDOW_WIDTH - 50)
-        self.y = -50
-        self.type = obj_type # 'normal', 'bomb', 'gold'
-        
-        if self.type == 'bomb':
-            self.color = COLOR_BOMB
-            self.radius = 35
-        elif self.type == 'gold':
-            self.color = COLOR_GOLD
-            self.radius = 25
+        live = np.flatnonzero(self.life > 0)
+        # Draw faded circle (simulated by shrinking size)
+        if draw_circles is not None:
+            sizes = (5 * self.life[live]).astype(np.int32)
+            draw_circles(img, self.x[live], self.y[live], sizes, self.color[live])
+            return
+        for x, y, size, color in zip(self.x[live].astype(np.int32).tolist(),
+                                     self.y[live].astype(np.int32).tolist(),
+                                     (5 * self.life[live]).astype(np.int32).tolist(),
+                                     self.color[live].tolist()):
+            cv2.circle(img, (x, y), size, tuple(color), -1)
+
+# Object type codes (stored in GameObjects.types)
+TYPE_NORMAL = 0
+TYPE_BOMB   = 1
+TYPE_GOLD   = 2
+
+class GameObjects:
+    """Fruits, Bombs, and Gold stored as parallel arrays (one entry per object).
+
+    The arrays are preallocated and only the first `count` entries are live;
+    the `xs`, `ys`, ... properties are views of that live part.
+    """
+    def __init__(self, rng, capacity=OBJECT_CAPACITY):
+        self.rng = rng
+        self.count = 0
+        self._xs = np.zeros(capacity, np.float32)
+        self._ys = np.zeros(capacity, np.float32)
+        self._radii = np.zeros(capacity, np.int32)
+        self._reach2 = np.zeros(capacity, np.int32)  # Squared hit distance to the finger
+        self._types = np.zeros(capacity, np.uint8)
+        self._colors = np.zeros((capacity, 3), np.uint8)
+
+    def _arrays(self):
+        return self._xs, self._ys, self._radii, self._reach2, self._types, self._colors
+
+    xs = property(lambda self: self._xs[:self.count])
+    ys = property(lambda self: self._ys[:self.count])
+    radii = property(lambda self: self._radii[:self.count])
+    reach2 = property(lambda self: self._reach2[:self.count])
+    types = property(lambda self: self._types[:self.count])
+    colors = property(lambda self: self._colors[:self.count])
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, obj_type):
+        x = self.rng.integers(50, WINDOW_WIDTH - 50, endpoint=True)
+
+        if obj_type == TYPE_BOMB:
+            color, radius = COLOR_BOMB, 35
+        elif obj_type == TYPE_GOLD:
+            color, radius = COLOR_GOLD, 25
         else:
-            self.color = (random.randint(50, 255), random.randint(50, 255), random.randint(50, 255))
-            self.radius = 30
+            color = self.rng.integers(50, 255, size=3, endpoint=True)
+            radius = 30
+
+        i = self.count
+        if i == len(self._xs):
+            # Out of room: double the capacity
+            (self._xs, self._ys, self._radii, self._reach2, self._types,
+             self._colors) = [np.concatenate((a, np.zeros_like(a))) for a in self._arrays()]
+
+        self._xs[i] = x
+        self._ys[i] = -50
+        self._radii[i] = radius
+        self._reach2[i] = (radius + CURSOR_RADIUS) ** 2
+        self._types[i] = obj_type
+        self._colors[i] = color
+        self.count = i + 1
+
+    def keep(self, mask):
+        """Drop every object whose entry in `mask` is False.
+
+        Swap-and-pop: dead slots inside the surviving range are filled with
+        the live objects from past its end, so only removed entries are
+        touched and nothing is reallocated. Object order is not preserved.
+        """
+        new_count = np.count_nonzero(mask)
+        if new_count == self.count:
+            return
+
+        holes = np.flatnonzero(~mask[:new_count])
+        fillers = np.flatnonzero(mask[new_count:]) + new_count
+        for a in self._arrays():
+            a[holes] = a[fillers]
+        self.count = new_count
+
+    def draw(self, img, bang):
+        """Draw all objects, using the `bang` sprite for the bomb glyph."""
+        # Local aliases keep attribute lookups out of the loops
+        circle, draw_bang = cv2.circle, bang.draw
+        xs = self.xs.astype(np.int32)
+        ys = self.ys.astype(np.int32)
+        bombs = self.types == TYPE_BOMB
+        others = ~bombs
+
+        if draw_circles is not None:
+            draw_circles(img, self.xs[others], self.ys[others], self.radii[others],
+                         self.colors[others], True)
+            draw_circles(img, self.xs[bombs], self.ys[bombs], self.radii[bombs],
+                         self.colors[bombs])
+            for x, y in zip(xs[bombs].tolist(), ys[bombs].tolist()):
+                draw_bang(img, (x-10, y+10))
+            return
+
+        # Fruits and Gold: filled circle with a white outline
+        for x, y, radius, color in zip(xs[others].tolist(), ys[others].tolist(),
+                                       self.radii[others].tolist(), self.colors[others].tolist()):
+            circle(img, (x, y), radius, color, -1)
+            circle(img, (x, y), radius, (255,255,255), 2)
+
+        # Bombs: all share a color, drawn with a "!" inside
+        for x, y, radius in zip(xs[bombs].tolist(), ys[bombs].tolist(), self.radii[bombs].tolist()):
+            circle(img, (x, y), radius, COLOR_BOMB, -1)
+            draw_bang(img, (x-10, y+10))
 
 class ARGamePro:
     def __init__(self):
+        # Keep OpenCV's own thread pool from competing with MediaPipe's
+        cv2.setNumThreads(1)
+
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             max_num_hands=1,
+            model_complexity=0,  # Lite landmark model
             min_detection_confidence=0.7,
             min_tracking_confidence=0.7
         )
         self.cap = cv2.VideoCapture(0)
+        # Let the camera deliver MJPG so 1280x720 keeps a high frame rate
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         self.cap.set(3, WINDOW_WIDTH)
         self.cap.set(4, WINDOW_HEIGHT)
+        # Keep only the newest frame in the driver queue (lower input lag)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # Capture runs on its own thread; only the latest frame is kept
+        self._latest = None
+        self._frame_lock = threading.Lock()
+        self._new_frame = threading.Event()
+        self._running = False
+
+        # Hand tracking runs on a worker thread and hands the render loop
+        # (frame, finger_pos) pairs through a single-slot queue
+        self._infer_q = queue.Queue(maxsize=1)
+        
+        self._rng = np.random.default_rng()
+
+        # JIT now, not on the first tick after SPACE
+        warm_up_kernels()
+
+        # Pre-rendered text
+        self._title_sprite = TextSprite("FINGER SLASH AR", 2, COLOR_GOLD, 4)
+        self._start_sprite = TextSprite("Press SPACE to Start", 1, COLOR_TEXT, 2)
+        self._game_over_sprite = TextSprite("GAME OVER", 2, COLOR_GOLD, 4)
+        self._final_score_sprites = (TextSprite("Final Score: ", 1, COLOR_TEXT, 2),
+                                     [TextSprite(str(d), 1, COLOR_TEXT, 2) for d in range(10)],
+                                     TextSprite(" | Press SPACE", 1, COLOR_TEXT, 2))
+        self._score_sprites = (TextSprite("Score: ", 1.5, COLOR_TEXT, 3),
+                               [TextSprite(str(d), 1.5, COLOR_TEXT, 3) for d in range(10)])
+        self._lives_sprites = (TextSprite("Lives: ", 1, (0,0,255), 2),
+                               TextSprite("<3 ", 1, (0,0,255), 2))
+        self._bang_sprite = TextSprite("!", 1, (255,255,255), 3)
+        
+        # Last drawn start / game-over screen, redrawn only when dirty
+        self._menu_cache = None
+        self._menu_dirty = True
         
         # Game Variables
         self.reset_game()
         
         # Smoothing variables
         self.prev_x, self.prev_y = 0, 0
+        self._have_prev = False
+
+        # Frame skipping state for hand tracking
+        self._track_frame = 0
+        self._hand_locked = False
+        self._finger_pos = None
+        # Reused MediaPipe input buffers
+        self._small = np.empty((TRACK_HEIGHT, TRACK_WIDTH, 3), np.uint8)
+        self._rgb = np.empty((TRACK_HEIGHT, TRACK_WIDTH, 3), np.uint8)
 
     def reset_game(self):
         self.score = 0
         self.lives = 3
         self.game_active = False
-        self.objects = []
-        self.particles = []
+        self.objects = GameObjects(self._rng)
+        self.particles = Particles(self._rng)
         self.speed = STARTING_SPEED
         self.game_over_timer = 0
+        self._menu_dirty = True
 
     def spawn_object(self):
         # 10% chance of Bomb, 5% chance of Gold, 85% Normal
-        rand = random.random()
+        rand = self._rng.random()
         if rand < 0.10:
-            self.objects.append(GameObject('bomb'))
+            self.objects.spawn(TYPE_BOMB)
         elif rand < 0.15:
-            self.objects.append(GameObject('gold'))
+            self.objects.spawn(TYPE_GOLD)
         else:
-            self.objects.append(GameObject('normal'))
+            self.objects.spawn(TYPE_NORMAL)
 
     def update(self, finger_pos):
         # Increase difficulty based on score
         self.speed = min(MAX_SPEED, STARTING_SPEED + (self.score // 10))
         
         # Update Particles
-        for p in self.particles[:]:
-            p.update()
-            if p.life <= 0:
-                self.particles.remove(p)
-
-        # Update Objects
-        for obj in self.objects[:]:
-            obj.y += self.speed
-            
-            # Remove if off screen
-            if obj.y > WINDOW_HEIGHT:
-                self.objects.remove(obj)
-                continue
-            
-            # Collision Detection
-            if finger_pos:
-                fx, fy = finger_pos
-                dist = math.hypot(fx - obj.x, fy - obj.y)
-                
-                if dist < (obj.radius + 15):
-                    # HIT!
-                    self.create_explosion(obj.x, obj.y, obj.color)
-                    
-                    if obj.type == 'bomb':
-                        self.lives -= 1
-                        self.objects.remove(obj)
-                        if self.lives <= 0:
-                            self.end_game()
-                    elif obj.type == 'gold':
-                        self.score += 5
-                        self.objects.remove(obj)
-                    else:
-                        self.score += 1
-                        self.objects.remove(obj)
+        self.particles.update()
+
+        # Update Objects & Collision Detection
+        objs = self.objects
+        fx, fy = finger_pos if finger_pos else (0, 0)
+        alive, hit = update_objects(objs.xs, objs.ys, objs.reach2, float(self.speed),
+                                    float(fx), float(fy), finger_pos is not None)
+
+        if hit.any():
+            # HIT!
+            for x, y, color in zip(objs.xs[hit], objs.ys[hit], objs.colors[hit].tolist()):
+                self.create_explosion(x, y, tuple(color))
+
+            hit_types = objs.types[hit]
+            self.score += int(np.count_nonzero(hit_types == TYPE_NORMAL))
+            self.score += 5 * int(np.count_nonzero(hit_types == TYPE_GOLD))
+            self.lives -= int(np.count_nonzero(hit_types == TYPE_BOMB))
+            alive &= ~hit
+
+            if self.lives <= 0:
+                self.end_game()
+
+        objs.keep(alive)
 
     def create_explosion(self, x, y, color):
-        for _ in range(10): # Spawn 10 particles
-            self.particles.append(Particle(x, y, color))
+        self.particles.spawn(x, y, color, 10) # Spawn 10 particles
 
     def end_game(self):
         self.game_active = False
         self.game_over_timer = time.time()
+        self._menu_dirty = True
 
-    def run(self):
-        frame_count = 0
-        
+    def _capture_loop(self):
+        while self._running:
+            success, frame = self.cap.read()
+            if not success:
+                break
+            with self._frame_lock:
+                self._latest = frame
+            self._new_frame.set()
+
+        # Wake up the main loop so it notices the camera is gone
+        self._running = False
+        self._new_frame.set()
+
+    def get_latest_frame(self):
+        """Wait for a frame newer than the previous one. None if capture stopped."""
         while True:
-            success, img = self.cap.read()
-            if not success: break
-            
+            self._new_frame.wait()
+            self._new_frame.clear()
+            if not self._running:
+                return None
+            with self._frame_lock:
+                frame, self._latest = self._latest, None
+            # The event can fire for a frame that was already taken on the
+            # previous call; keep waiting for a fresh one
+            if frame is not None:
+                return frame
+
+    def track_finger(self, img, force=False):
+        """Return the smoothed index fingertip position in `img`, or None.
+
+        With `force`, MediaPipe runs even on a frame that would be skipped.
+        """
+        self._track_frame += 1
+
+        # While a confident hand is locked on, reuse its last position on
+        # skipped frames; the smoothing hides the missing update.
+        if not force and self._hand_locked and self._track_frame % TRACK_EVERY_N:
+            return self._finger_pos
+
+        # Landmarks come back normalized, so they map straight onto the full frame
+        cv2.resize(img, (TRACK_WIDTH, TRACK_HEIGHT), dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        # Read-only input lets MediaPipe use the buffer without copying it
+        self._rgb.flags.writeable = False
+        results = self.hands.process(self._rgb)
+        self._rgb.flags.writeable = True
+
+        if not results.multi_hand_landmarks:
+            self._hand_locked = False
+            self._finger_pos = None
+            return None
+
+        # --- Hand Tracking & Smoothing ---
+        lm = results.multi_hand_landmarks[0].landmark[8] # Index tip
+        h, w, _ = img.shape
+        cx, cy = int(lm.x * w), int(lm.y * h)
+
+        # Smooth the movement (reduces jitter): 50/50 average with the last position
+        if not self._have_prev:
+            self.prev_x, self.prev_y = cx, cy
+            self._have_prev = True
+        cx = (self.prev_x + cx) >> 1
+        cy = (self.prev_y + cy) >> 1
+        self.prev_x, self.prev_y = cx, cy
+
+        # Low confidence: run the full detector again on the next frame
+        confidence = results.multi_handedness[0].classification[0].score
+        self._hand_locked = confidence >= TRACK_MIN_CONFIDENCE
+
+        self._finger_pos = (cx, cy)
+        return self._finger_pos
+
+    def _inference_loop(self):
+        menu_frame = 0
+        while True:
+            img = self.get_latest_frame()
+            if img is None:
+                self._publish((None, None))
+                break
+
+            # On the start / game-over screen only every MENU_TRACK_EVERY-th
+            # frame is tracked and shown; the render loop reuses its cached
+            # menu image in between. Those frames are already sparse, so they
+            # are always tracked rather than reusing the last position.
+            menu = not self.game_active
+            if menu:
+                menu_frame += 1
+                if menu_frame % MENU_TRACK_EVERY:
+                    continue
+
             # Flip and process
             img = cv2.flip(img, 1)
-            img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(img_rgb)
-            
-            finger_pos = None
+            self._publish((img, self.track_finger(img, force=menu)))
 
-            # --- Hand Tracking & Smoothing ---
-            if results.multi_hand_landmarks:
-                lm = results.multi_hand_landmarks[0].landmark[8] # Index tip
-                h, w, _ = img.shape
-                cx, cy = int(lm.x * w), int(lm.y * h)
-                
-                # Smooth the movement (reduces jitter)
-                if self.prev_x == 0: self.prev_x, self.prev_y = cx, cy
-                cx = int(self.prev_x * 0.5 + cx * 0.5)
-                cy = int(self.prev_y * 0.5 + cy * 0.5)
-                self.prev_x, self.prev_y = cx, cy
-                
-                finger_pos = (cx, cy)
-                
-                # Draw Finger Cursor
-                cv2.circle(img, (cx, cy), 15, COLOR_PLAYER, 2)
-                cv2.circle(img, (cx, cy), 5, COLOR_PLAYER, -1)
-                # Draw "Laser" line from bottom
-                cv2.line(img, (WINDOW_WIDTH//2, WINDOW_HEIGHT), (cx, cy), (0, 255, 0, 100), 1)
-
-            # --- Game Logic ---
-            if self.game_active:
-                frame_count += 1
-                if frame_count % SPAWN_RATE == 0:
-                    self.spawn_object()
-                
-                self.update(finger_pos)
+    def _publish(self, item):
+        """Put `item` on the inference queue, replacing any unread result."""
+        try:
+            self._infer_q.put_nowait(item)
+        except queue.Full:
+            try:
+                self._infer_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._infer_q.put_nowait(item)
+
+    def run(self):
+        frame_count = 0
+        frame_time = 1.0 / RENDER_FPS
+
+        self._running = True
+        capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        inference_thread = threading.Thread(target=self._inference_loop, daemon=True)
+        capture_thread.start()
+        inference_thread.start()
+
+        # Wait for the first tracked frame
+        frame, finger_pos = self._infer_q.get()
+        next_tick = time.perf_counter()
+        
+        while frame is not None:
+            # Take the newest tracking result if there is one; otherwise keep
+            # animating on top of the last frame and finger position
+            try:
+                frame, finger_pos = self._infer_q.get_nowait()
+                if frame is None: break
+                self._menu_dirty = True
+            except queue.Empty:
+                pass
+            if not self.game_active and not self._menu_dirty:
+                # Menu screen is unchanged since the last tick; show it again
+                img = self._menu_cache
+            else:
+                img = frame.copy()
+
+                if finger_pos:
+                    cx, cy = finger_pos
+                    # Draw Finger Cursor
+                    cv2.circle(img, (cx, cy), CURSOR_RADIUS, COLOR_PLAYER, 2)
+                    cv2.circle(img, (cx, cy), 5, COLOR_PLAYER, -1)
+                    # Draw "Laser" line: a short stub pointing from the cursor
+                    # back toward the bottom centre of the screen
+                    dx, dy = WINDOW_WIDTH//2 - cx, WINDOW_HEIGHT - cy
+                    length = (dx * dx + dy * dy) ** 0.5
+                    if length > LASER_LENGTH:
+                        dx, dy = int(dx * LASER_LENGTH / length), int(dy * LASER_LENGTH / length)
+                    cv2.line(img, (cx, cy), (cx + dx, cy + dy), COLOR_PLAYER, 1, cv2.LINE_8)
+
+                # --- Game Logic ---
+                if self.game_active:
+                    frame_count += 1
+                    if frame_count % SPAWN_RATE == 0:
+                        self.spawn_object()
                 
-                # Draw Elements
-                for obj in self.objects:
-                    # Draw Bomb (X shape inside circle)
-                    if obj.type == 'bomb':
-                        cv2.circle(img, (int(obj.x), int(obj.y)), obj.radius, obj.color, -1)
-                        cv2.putText(img, "!", (int(obj.x)-10, int(obj.y)+10), cv2.FONT_HERSHEY_SIMPLEX, 1, (255,255,255), 3)
-                    else:
-                        cv2.circle(img, (int(obj.x), int(obj.y)), obj.radius, obj.color, -1)
-                        cv2.circle(img, (int(obj.x), int(obj.y)), obj.radius, (255,255,255), 2)
+                    self.update(finger_pos)
                 
-                for p in self.particles:
-                    p.draw(img)
+                    # Draw Elements
+                    self.objects.draw(img, self._bang_sprite)
+                    self.particles.draw(img)
 
-                # UI Overlay
-                cv2.putText(img, f"Score: {self.score}", (50, 80), cv2.FONT_HERSHEY_SIMPLEX, 1.5, COLOR_TEXT, 3)
-                cv2.putText(img, f"Lives: {'<3 '*self.lives}", (50, 150), cv2.FONT_HERSHEY_SIMPLEX, 1, (0,0,255), 2)
+                    # UI Overlay
+                    label, digits = self._score_sprites
+                    draw_sprites(img, [label] + [digits[int(c)] for c in str(self.score)], (50, 80))
+                    label, heart = self._lives_sprites
+                    draw_sprites(img, [label] + [heart] * self.lives, (50, 150))
             
-            else:
-                # Start Screen / Game Over Screen
-                overlay = img.copy()
-                cv2.rectangle(overlay, (0, 0), (WINDOW_WIDTH, WINDOW_HEIGHT), (0, 0, 0), -1)
-                cv2.addWeighted(overlay, 0.6, img, 0.4, 0, img)
-                
-                if self.score == 0 and self.game_over_timer == 0:
-                    title = "FINGER SLASH AR"
-                    sub = "Press SPACE to Start"
                 else:
-                    title = "GAME OVER"
-                    sub = f"Final Score: {self.score} | Press SPACE"
+                    # Start Screen / Game Over Screen
+                    # Dim in place (same as blending 60% black over the frame)
+                    cv2.convertScaleAbs(img, dst=img, alpha=0.4)
+                
+                    if self.score == 0 and self.game_over_timer == 0:
+                        title = self._title_sprite
+                        sub = [self._start_sprite]
+                    else:
+                        title = self._game_over_sprite
+                        label, digits, suffix = self._final_score_sprites
+                        sub = [label] + [digits[int(c)] for c in str(self.score)] + [suffix]
                 
-                cv2.putText(img, title, (WINDOW_WIDTH//2 - 200, WINDOW_HEIGHT//2 - 50), cv2.FONT_HERSHEY_SIMPLEX, 2, COLOR_GOLD, 4)
-                cv2.putText(img, sub, (WINDOW_WIDTH//2 - 250, WINDOW_HEIGHT//2 + 50), cv2.FONT_HERSHEY_SIMPLEX, 1, COLOR_TEXT, 2)
+                    title.draw(img, (WINDOW_WIDTH//2 - 200, WINDOW_HEIGHT//2 - 50))
+                    draw_sprites(img, sub, (WINDOW_WIDTH//2 - 250, WINDOW_HEIGHT//2 + 50))
+                    self._menu_cache = img
+                    self._menu_dirty = False
 
             cv2.imshow("AR Game Pro", img)
+
+            # Keep a steady game tick rate
+            next_tick += frame_time
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()
             
-            key = cv2.waitKey(1)
+            # Non-blocking: the tick pacing above already does the waiting
+            key = cv2.pollKey()
             if key == ord('q'):
                 break
             if key == 32: # Space
@@ -228,6 +577,9 @@ class ARGamePro:
                     self.reset_game()
                     self.game_active = True
 
+        self._running = False
+        capture_thread.join()
+        inference_thread.join()
         self.cap.release()
         cv2.destroyAllWindows()
 